@@ -4,74 +4,356 @@ import numpy as np
 import smtplib
 import ssl
 import time
+import functools
+import queue
+import threading
 import re
-import json
-import plotly.express as px
-import plotly.graph_objects as go
+import io
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
-from email_validator import validate_email, EmailNotValidError
+from email.header import Header
 from dotenv import load_dotenv
 import os
 from datetime import datetime, timedelta
-import io
-import base64
-from groq import Groq
-import requests
-from PIL import Image
+from types import MappingProxyType
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
 
 # Load environment variables
 load_dotenv()
 
+def env_number(name, default, cast, low, high):
+    """Read a numeric setting from the environment, falling back to the default and clamping to [low, high]"""
+    try:
+        value = cast(os.getenv(name, default))
+    except ValueError:
+        value = cast(default)
+    if value != value:  # NaN
+        value = cast(default)
+    return min(max(value, low), high)
+
 # Configuration
 GROQ_API_KEY = os.getenv("GROQ_API_KEY")
 GMAIL_USER = os.getenv("GMAIL_USER")
 GMAIL_APP_PASSWORD = os.getenv("GMAIL_APP_PASSWORD")
 
+# Bulk sending: parallel SMTP sessions (Gmail allows at most 15 concurrent connections)
+SMTP_POOL_SIZE = env_number("GMAIL_CONCURRENCY", "5", int, 1, 15)
+SMTP_MAX_RETRIES = 3
+SMTP_MAX_PER_SECOND = env_number("SMTP_MAX_PER_SECOND", "10", float, 0.1, 100.0)
+# Slowest pace the rate limiter backs off to, in seconds between messages
+SMTP_MAX_SEND_INTERVAL = 5.0
+# Messages sent on one session before it is replaced by a fresh login
+SMTP_MAX_MESSAGES_PER_SESSION = 100
+# Personalized messages queued for the send workers at once, topped up as sends finish
+SMTP_SEND_WINDOW = 2 * SMTP_POOL_SIZE
+
+# Concurrent DNS deliverability lookups when validating an upload
+DNS_LOOKUP_WORKERS = 16
+
+# Analytics charts: histogram bins and the most points a scatter plot ships to the browser
+HISTOGRAM_BINS = 50
+PLOT_SAMPLE_SIZE = 10_000
+
+# Rows parsed from an analytics upload before the full analysis is requested
+PREVIEW_ROWS = 1000
+
+# Contacts and send results live in session state as Arrow strings, not a Python object per cell
+SESSION_STRING_DTYPE = 'string[pyarrow]'
+
+# Cheap syntactic email check, applied to whole columns before the slower email_validator
+EMAIL_RE = re.compile(r'^[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}$')
+# Domain part of an address: whatever follows the last '@' (no match, so NaN, without one)
+EMAIL_DOMAIN_RE = re.compile(r'@([^@]*)$')
+# Digits and separators stripped from an email's local part when guessing a name
+NAME_SEPARATOR_RE = re.compile(r'[0-9._-]+')
+
+# Personalization placeholders, in either {field} or {{field}} form
+PLACEHOLDER_RE = re.compile(r'\{\{(name|first_name|email)\}\}|\{(name|first_name|email)\}')
+
 # Countries and Currencies data with coordinates
-COUNTRIES_DATA = {
-    "Global": {"coords": [0, 0], "currency": "USD"},
-    "United States": {"coords": [39.8283, -98.5795], "currency": "USD"},
-    "Canada": {"coords": [56.1304, -106.3468], "currency": "CAD"},
-    "United Kingdom": {"coords": [55.3781, -3.4360], "currency": "GBP"},
-    "Germany": {"coords": [51.1657, 10.4515], "currency": "EUR"},
-    "France": {"coords": [46.6034, 1.8883], "currency": "EUR"},
-    "Spain": {"coords": [40.4637, -3.7492], "currency": "EUR"},
-    "Italy": {"coords": [41.8719, 12.5674], "currency": "EUR"},
-    "Netherlands": {"coords": [52.1326, 5.2913], "currency": "EUR"},
-    "Australia": {"coords": [-25.2744, 133.7751], "currency": "AUD"},
-    "Japan": {"coords": [36.2048, 138.2529], "currency": "JPY"},
-    "India": {"coords": [20.5937, 78.9629], "currency": "INR"},
-    "China": {"coords": [35.8617, 104.1954], "currency": "CNY"},
-    "Brazil": {"coords": [-14.2350, -51.9253], "currency": "BRL"},
-    "Mexico": {"coords": [23.6345, -102.5528], "currency": "MXN"}
-}
-
-COUNTRIES = list(COUNTRIES_DATA.keys())
-CURRENCIES = ["USD", "EUR", "GBP", "CAD", "AUD", "JPY", "CHF", "INR", "BRL", "MXN", "CNY"]
+# Read-only: shared by every session and rerun
+COUNTRIES_DATA = MappingProxyType({
+    "Global": {"coords": (0, 0), "currency": "USD"},
+    "United States": {"coords": (39.8283, -98.5795), "currency": "USD"},
+    "Canada": {"coords": (56.1304, -106.3468), "currency": "CAD"},
+    "United Kingdom": {"coords": (55.3781, -3.4360), "currency": "GBP"},
+    "Germany": {"coords": (51.1657, 10.4515), "currency": "EUR"},
+    "France": {"coords": (46.6034, 1.8883), "currency": "EUR"},
+    "Spain": {"coords": (40.4637, -3.7492), "currency": "EUR"},
+    "Italy": {"coords": (41.8719, 12.5674), "currency": "EUR"},
+    "Netherlands": {"coords": (52.1326, 5.2913), "currency": "EUR"},
+    "Australia": {"coords": (-25.2744, 133.7751), "currency": "AUD"},
+    "Japan": {"coords": (36.2048, 138.2529), "currency": "JPY"},
+    "India": {"coords": (20.5937, 78.9629), "currency": "INR"},
+    "China": {"coords": (35.8617, 104.1954), "currency": "CNY"},
+    "Brazil": {"coords": (-14.2350, -51.9253), "currency": "BRL"},
+    "Mexico": {"coords": (23.6345, -102.5528), "currency": "MXN"}
+})
+
+COUNTRIES = tuple(COUNTRIES_DATA)
+CURRENCIES = ("USD", "EUR", "GBP", "CAD", "AUD", "JPY", "CHF", "INR", "BRL", "MXN", "CNY")
 
 # ================================
 # SESSION STATE INITIALIZATION
 # ================================
 
+# Per-session defaults; values are immutable because every session starts from the same objects
+SESSION_DEFAULTS = MappingProxyType({
+    'current_page': "Campaign Dashboard",
+    'current_campaign': None,
+    'campaign_blueprint': None,
+    'email_template': None,
+    'email_contacts': None,
+    'campaign_results': None,
+    'plain_text_template': None,
+    'generated_images': (),
+    'launch_confirmed': False
+})
+
 def initialize_session_state():
     """Initialize all session state variables"""
-    if 'current_page' not in st.session_state:
-        st.session_state.current_page = "Campaign Dashboard"
-    if 'current_campaign' not in st.session_state:
-        st.session_state.current_campaign = None
-    if 'campaign_blueprint' not in st.session_state:
-        st.session_state.campaign_blueprint = None
-    if 'email_template' not in st.session_state:
-        st.session_state.email_template = None
-    if 'email_contacts' not in st.session_state:
-        st.session_state.email_contacts = None
-    if 'campaign_results' not in st.session_state:
-        st.session_state.campaign_results = None
-    if 'plain_text_template' not in st.session_state:
-        st.session_state.plain_text_template = None
-    if 'generated_images' not in st.session_state:
-        st.session_state.generated_images = []
+    for key, value in SESSION_DEFAULTS.items():
+        st.session_state.setdefault(key, value)
+
+# ================================
+# CACHED RESOURCES
+# ================================
+
+def open_smtp_connection():
+    """Open an authenticated Gmail SMTP session"""
+    server = smtplib.SMTP("smtp.gmail.com", 587)
+    try:
+        server.ehlo()
+        server.starttls(context=ssl.create_default_context())
+        server.login(GMAIL_USER, GMAIL_APP_PASSWORD)
+    except Exception:
+        server.close()
+        raise
+    return server
+
+def close_smtp_pool(pool):
+    """Close every session left in an SMTP pool"""
+    while True:
+        try:
+            server, _ = pool.get_nowait()
+        except queue.Empty:
+            return
+        try:
+            server.close()
+        except Exception:
+            pass
+
+# No TTL: sessions Gmail has dropped are replaced by _send_pooled's reconnect on SMTPServerDisconnected
+@st.cache_resource(show_spinner=False, on_release=close_smtp_pool)
+def get_smtp_pool():
+    """Pool of authenticated SMTP sessions, each with its sent-message count, reused across campaigns and reruns"""
+    pool = queue.Queue()
+    try:
+        for _ in range(SMTP_POOL_SIZE):
+            pool.put((open_smtp_connection(), 0))
+    except Exception:
+        # Don't leak the sessions that did log in before the failure
+        close_smtp_pool(pool)
+        raise
+    return pool
+
+@st.cache_resource(show_spinner=False)
+def get_groq_client():
+    """Shared Groq client; a construction error propagates, so it is retried instead of cached"""
+    # groq pulls in httpx/pydantic (~150 ms); only load it when a campaign is generated
+    from groq import Groq
+    
+    return Groq(api_key=GROQ_API_KEY)
+
+@st.cache_resource(show_spinner=False)
+def get_email_handler():
+    """Shared email handler"""
+    return EmailHandler()
+
+@st.cache_resource(show_spinner=False)
+def get_personalizer():
+    """Shared email personalizer"""
+    return EmailPersonalizer()
+
+@st.cache_resource(show_spinner=False)
+def get_file_processor():
+    """Shared contact file processor"""
+    return FileProcessor()
+
+@st.cache_resource(show_spinner=False)
+def get_send_rate_limiter():
+    """One limiter per process, since Gmail's sending quota is per account"""
+    return RateLimiter(SMTP_MAX_PER_SECOND)
+
+@st.cache_data(ttl=3600, max_entries=64, show_spinner=False)
+def cached_campaign_blueprint(_generator, company_name, campaign_type, target_audience, location,
+                              city_state, channels, budget, currency, duration, product_description):
+    """Generate a campaign blueprint once per unique set of prompt inputs"""
+    return _generator._request_blueprint({
+        'company_name': company_name,
+        'campaign_type': campaign_type,
+        'target_audience': target_audience,
+        'location': location,
+        'city_state': city_state,
+        'channels': list(channels),
+        'budget': budget,
+        'currency': currency,
+        'duration': duration,
+        'product_description': product_description
+    })
+
+@st.cache_data(max_entries=8, show_spinner=False)
+def cached_contacts(file_bytes, file_name):
+    """Parse an uploaded contact file once per distinct file content"""
+    return get_file_processor().process_file(file_bytes, file_name)
+
+@st.cache_data(max_entries=8, show_spinner=False)
+def cached_performance_preview(file_bytes, file_name):
+    """Parse only the first rows of an uploaded performance data file for the preview"""
+    if file_name.endswith('.csv'):
+        return pd.read_csv(io.BytesIO(file_bytes), nrows=PREVIEW_ROWS)
+    return pd.read_excel(io.BytesIO(file_bytes), nrows=PREVIEW_ROWS)
+
+@st.cache_data(max_entries=8, show_spinner=False)
+def cached_performance_data(file_bytes, file_name):
+    """Parse an uploaded performance data file once per distinct file content"""
+    if file_name.endswith('.csv'):
+        try:
+            return pd.read_csv(io.BytesIO(file_bytes), engine='pyarrow')
+        except ValueError:
+            # pyarrow rejects some CSV quirks the C parser tolerates
+            return pd.read_csv(io.BytesIO(file_bytes))
+    try:
+        return pd.read_excel(io.BytesIO(file_bytes), engine='calamine')
+    except ImportError:
+        return pd.read_excel(io.BytesIO(file_bytes))
+
+@st.cache_data(ttl=3600, max_entries=64, show_spinner=False)
+def cached_email_template(email_type, company_name, is_html):
+    """Build the starter email template for an email type and sender"""
+    if is_html:
+        return f"""
+<!DOCTYPE html>
+<html>
+<head><title>{email_type}</title></head>
+<body style="font-family: Arial, sans-serif; max-width: 600px; margin: 0 auto; padding: 20px;">
+    <div style="background: linear-gradient(135deg, #00d4ff, #0099cc); color: white; padding: 30px; text-align: center; border-radius: 8px 8px 0 0;">
+        <h1>Hello {{{{first_name}}}}!</h1>
+    </div>
+    <div style="padding: 30px; background: white; color: #333;">
+        <p>We're excited to share this {email_type.lower()} with you.</p>
+        <p>As someone who values quality, we thought you'd be interested in what we have to offer.</p>
+        <div style="text-align: center; margin: 30px 0;">
+            <a href="#" style="background: #00d4ff; color: white; padding: 15px 30px; text-decoration: none; border-radius: 5px; font-weight: bold;">Learn More</a>
+        </div>
+        <p>Thank you for being part of our community!</p>
+    </div>
+    <div style="background: #f8f9fa; padding: 20px; text-align: center; border-radius: 0 0 8px 8px;">
+        <p>Best regards,<br>The {company_name} Team</p>
+    </div>
+</body>
+</html>"""
+    return f"""Subject: {email_type} from {{{{first_name}}}}
+
+Hello {{{{first_name}}}},
+
+We're excited to share this {email_type.lower()} with you.
+
+As someone who values quality, we thought you'd be interested in what we have to offer.
+
+Here's what makes this special:
+- Personalized for you
+- Exclusive benefits
+- Limited time opportunity
+
+Ready to learn more? Visit our website or reply to this email.
+
+Thank you for being part of our community!
+
+Best regards,
+The {company_name} Team"""
+
+@st.cache_data(max_entries=32, show_spinner=False)
+def cached_location_map(location, lat, lon, campaign_type, company_name):
+    """Build the campaign target map figure"""
+    import plotly.express as px
+    
+    map_data = pd.DataFrame({
+        'lat': [lat],
+        'lon': [lon], 
+        'location': [location],
+        'campaign': [campaign_type],
+        'company': [company_name]
+    })
+    
+    fig = px.scatter_mapbox(
+        map_data,
+        lat='lat',
+        lon='lon',
+        hover_name='location',
+        hover_data={'campaign': True, 'company': True, 'lat': False, 'lon': False},
+        color_discrete_sequence=['#00d4ff'],
+        size_max=15,
+        zoom=3,
+        title=f"Campaign Target Location: {location}"
+    )
+    
+    fig.update_layout(
+        mapbox_style="carto-darkmatter",
+        mapbox_accesstoken=None,
+        template="plotly_dark",
+        height=500
+    )
+    return fig
+
+@st.cache_data(max_entries=32, show_spinner=False)
+def cached_results_pie(status_counts):
+    """Build the campaign results pie chart from (status, count) pairs"""
+    import plotly.express as px
+    
+    fig = px.pie(
+        values=[count for _, count in status_counts],
+        names=[status for status, _ in status_counts],
+        title="Email Campaign Results Distribution",
+        color_discrete_map={'sent': '#28a745', 'failed': '#dc3545', 'invalid': '#ffc107'}
+    )
+    fig.update_layout(template="plotly_dark")
+    return fig
+
+@st.cache_data(max_entries=32, show_spinner=False)
+def cached_domain_bar(domain_counts):
+    """Build the top email domains bar chart from (domain, count) pairs"""
+    import plotly.express as px
+    
+    fig = px.bar(x=[domain for domain, _ in domain_counts], y=[count for _, count in domain_counts],
+                title="Top Email Domains Reached")
+    fig.update_layout(template="plotly_dark")
+    return fig
+
+@st.cache_data(max_entries=32, show_spinner=False)
+def cached_histogram(data_df, column):
+    """Build the distribution histogram for one uploaded data column"""
+    import plotly.express as px
+    
+    # Bin in numpy and send only the bar heights, not every row, to the browser
+    values = data_df[column].to_numpy(dtype=float, na_value=np.nan)
+    counts, edges = np.histogram(values[np.isfinite(values)], bins=HISTOGRAM_BINS)
+    fig = px.bar(x=(edges[:-1] + edges[1:]) / 2, y=counts, labels={'x': column, 'y': 'count'},
+                title=f"Distribution of {column}")
+    fig.update_layout(template="plotly_dark", bargap=0)
+    return fig
+
+@st.cache_data(max_entries=32, show_spinner=False)
+def cached_scatter(data_df, x_column, y_column):
+    """Build the scatter plot for two uploaded data columns"""
+    import plotly.express as px
+    
+    # A sample keeps the figure payload bounded on large uploads
+    if len(data_df) > PLOT_SAMPLE_SIZE:
+        data_df = data_df.sample(PLOT_SAMPLE_SIZE, random_state=0)
+    fig = px.scatter(data_df, x=x_column, y=y_column, title=f"{x_column} vs {y_column}")
+    fig.update_layout(template="plotly_dark")
+    return fig
 
 # ================================
 # UTILITY CLASSES
@@ -81,11 +363,12 @@ class EmailPersonalizer:
     """Handle intelligent email personalization"""
     
     @staticmethod
+    @functools.lru_cache(maxsize=65536)
     def extract_name_from_email(email):
         """Extract potential name from email address"""
         try:
             local_part = email.split('@')[0]
-            name_part = re.sub(r'[0-9._-]', ' ', local_part)
+            name_part = NAME_SEPARATOR_RE.sub(' ', local_part)
             name_parts = [part.capitalize() for part in name_part.split() if len(part) > 1]
             return ' '.join(name_parts) if name_parts else 'Valued Customer'
         except:
@@ -96,14 +379,62 @@ class EmailPersonalizer:
         """Personalize email template"""
         first_name = name.split()[0] if name and ' ' in name else name
         
-        personalized = template.replace('{name}', name or 'Valued Customer')
-        personalized = personalized.replace('{{name}}', name or 'Valued Customer')
-        personalized = personalized.replace('{first_name}', first_name or 'Valued Customer')
-        personalized = personalized.replace('{{first_name}}', first_name or 'Valued Customer')
-        personalized = personalized.replace('{email}', email or '')
-        personalized = personalized.replace('{{email}}', email or '')
+        values = {
+            'name': name or 'Valued Customer',
+            'first_name': first_name or 'Valued Customer',
+            'email': email or ''
+        }
         
-        return personalized
+        # Stitch the pre-split template back together; no regex scan per recipient
+        literals, fields = EmailPersonalizer._split_template(template)
+        pieces = [literals[0]]
+        for field, literal in zip(fields, literals[1:]):
+            pieces.append(values[field])
+            pieces.append(literal)
+        return ''.join(pieces)
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=32)
+    def _split_template(template):
+        """Split a template once into its literal text and the {field}/{{field}} placeholders between"""
+        parts = PLACEHOLDER_RE.split(template)
+        fields = tuple(double or single for double, single in zip(parts[1::3], parts[2::3]))
+        return tuple(parts[0::3]), fields
+
+class RateLimiter:
+    """Thread-safe pacing for outgoing mail, shared by all send workers"""
+    
+    def __init__(self, max_per_second):
+        self.base_interval = 1.0 / max_per_second
+        self.max_interval = max(self.base_interval, SMTP_MAX_SEND_INTERVAL)
+        self.interval = self.base_interval
+        self.next_slot = time.monotonic()
+        self.backoff_until = 0.0
+        self.last_backoff = float('-inf')
+        self.lock = threading.Lock()
+    
+    def acquire(self):
+        """Reserve the next send slot and wait for it"""
+        with self.lock:
+            now = time.monotonic()
+            if now >= self.backoff_until:
+                self.interval = self.base_interval
+            wait = max(0.0, self.next_slot - now)
+            self.next_slot = max(self.next_slot, now) + self.interval
+        time.sleep(wait)
+    
+    def backoff(self):
+        """Halve the send rate, down to a floor, until a minute after the server first pushed back"""
+        with self.lock:
+            now = time.monotonic()
+            # Workers rejected in the same burst slow the pace once, not once each
+            if now - self.last_backoff < self.interval:
+                return
+            self.last_backoff = now
+            self.interval = min(self.interval * 2, self.max_interval)
+            # The window is not extended by further pushback, so the pace recovers after it
+            if now >= self.backoff_until:
+                self.backoff_until = now + 60
 
 class EmailHandler:
     """Fixed email handling with proper error handling"""
@@ -114,39 +445,94 @@ class EmailHandler:
         self.email = GMAIL_USER
         self.password = GMAIL_APP_PASSWORD
     
-    def validate_email_address(self, email):
-        try:
-            validate_email(email)
-            return True
-        except EmailNotValidError:
-            return False
-    
     def send_single_email(self, to_email, subject, body, is_html=True):
         """Send a single email with detailed error handling"""
         if not self.email or not self.password:
             return False, "Gmail credentials not configured in .env file"
             
         try:
-            msg = MIMEMultipart('alternative')
-            msg['From'] = self.email
-            msg['To'] = to_email
-            msg['Subject'] = subject
-            
-            if is_html:
-                msg.attach(MIMEText(body, 'html'))
-            else:
-                msg.attach(MIMEText(body, 'plain'))
+            # One-off sends use their own short-lived session, so they never wait on a campaign holding the pool
+            with open_smtp_connection() as server:
+                return self._send_on_session(server, to_email, subject, body, 'html' if is_html else 'plain')
+        except smtplib.SMTPAuthenticationError:
+            return False, "Gmail authentication failed. Check your app password."
+        except Exception as e:
+            return False, f"SMTP Error: {str(e)}"
+    
+    def _send_pooled(self, pool, limiter, to_email, subject, body, subtype='html'):
+        """Send an email on a pooled SMTP session, retrying transient failures with backoff"""
+        server, sent_on_session = pool.get()
+        try:
+            # Gmail starts throttling long-lived sessions; rotate each one after a fixed number of messages
+            if sent_on_session >= SMTP_MAX_MESSAGES_PER_SESSION:
+                try:
+                    server.close()
+                    server, sent_on_session = open_smtp_connection(), 0
+                except Exception as e:
+                    return False, f"SMTP Error: {str(e)}"
             
-            context = ssl.create_default_context()
-            with smtplib.SMTP(self.smtp_server, self.smtp_port) as server:
-                server.starttls(context=context)
-                server.login(self.email, self.password)
-                text = msg.as_string()
-                server.sendmail(self.email, to_email, text)
+            for attempt in range(SMTP_MAX_RETRIES):
+                limiter.acquire()
+                try:
+                    result = self._send_on_session(server, to_email, subject, body, subtype)
+                    sent_on_session += 1
+                    return result
+                except smtplib.SMTPServerDisconnected as e:
+                    error_msg = f"SMTP Error: {str(e)}"
+                except smtplib.SMTPResponseException as e:
+                    # Throttled (421/450 and friends): slow every worker down, not just this one
+                    limiter.backoff()
+                    error_msg = f"SMTP Error: {str(e)}"
+                
+                if attempt == SMTP_MAX_RETRIES - 1:
+                    break
+                
+                # Back off, then replace the connection before the next attempt
+                time.sleep(2 ** attempt)
+                try:
+                    server.close()
+                    server, sent_on_session = open_smtp_connection(), 0
+                except Exception as e:
+                    error_msg = f"SMTP Error: {str(e)}"
             
+            return False, error_msg
+        finally:
+            pool.put((server, sent_on_session))
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=128)
+    def _message_frame(sender, body, subtype):
+        """Serialize everything except To/Subject once; recipients sharing a body reuse the bytes"""
+        msg = MIMEMultipart('alternative')
+        msg['From'] = sender
+        msg.attach(MIMEText(body, subtype))
+        return msg.as_bytes(policy=msg.policy.clone(linesep='\r\n'))
+    
+    @staticmethod
+    def _header_line(name, value):
+        """Encode one header line, RFC 2047-encoding non-ASCII values and dropping line breaks"""
+        value = ' '.join(str(value).splitlines())
+        if not value.isascii():
+            value = Header(value, 'utf-8').encode(linesep='\r\n')
+        return f"{name}: {value}\r\n".encode('ascii')
+    
+    def _send_on_session(self, server, to_email, subject, body, subtype='html'):
+        """Send an email over an already authenticated SMTP session"""
+        # Only the To and Subject headers are encoded per recipient; the rest comes pre-serialized
+        message = (self._header_line('To', to_email) + self._header_line('Subject', subject)
+                   + self._message_frame(self.email, body, subtype))
+        
+        try:
+            server.sendmail(self.email, [to_email], message)
             return True, "Success"
-        except smtplib.SMTPAuthenticationError:
-            return False, "Gmail authentication failed. Check your app password."
+        except smtplib.SMTPServerDisconnected:
+            # Let the caller reconnect and retry
+            raise
+        except smtplib.SMTPResponseException as e:
+            # 4xx replies are transient (throttling, busy server): retry as well
+            if 400 <= e.smtp_code < 500:
+                raise
+            return False, f"SMTP Error: {str(e)}"
         except smtplib.SMTPRecipientsRefused:
             return False, f"Recipient {to_email} was refused"
         except Exception as e:
@@ -160,7 +546,6 @@ class EmailHandler:
             return pd.DataFrame()
         
         total_emails = len(email_list)
-        results = []
         
         # Create progress components outside the loop
         progress_placeholder = st.empty()
@@ -171,85 +556,154 @@ class EmailHandler:
         failed_count = 0
         invalid_count = 0
         
-        # Send emails one by one
-        for index, row in email_list.iterrows():
-            # Update progress
-            progress = (index + 1) / total_emails
-            progress_placeholder.progress(progress)
-            status_placeholder.text(f"Sending email {index + 1} of {total_emails} to {row['email']}...")
-            
-            # Validate email
-            if not self.validate_email_address(row['email']):
-                invalid_count += 1
-                results.append({
-                    "email": row['email'],
-                    "name": row.get('name', 'Unknown'),
-                    "status": "invalid",
-                    "error": "Invalid email format"
-                })
-                continue
-            
-            # Prepare personalized content
-            name = row.get('name', personalizer.extract_name_from_email(row['email']))
-            personalized_body = personalizer.personalize_template(body_template, name, row['email'])
-            personalized_subject = personalizer.personalize_template(subject, name, row['email'])
-            
-            # Send email
-            success, error_msg = self.send_single_email(
-                row['email'], 
-                personalized_subject, 
-                personalized_body, 
-                is_html=is_html
-            )
-            
-            if success:
-                sent_count += 1
-                status = "sent"
-            else:
-                failed_count += 1
-                status = "failed"
+        # Check out the shared pool of authenticated SMTP sessions
+        try:
+            pool = get_smtp_pool()
+            limiter = get_send_rate_limiter()
+        except smtplib.SMTPAuthenticationError:
+            st.error("❌ Gmail authentication failed. Check your app password.")
+            return pd.DataFrame()
+        except Exception as e:
+            st.error(f"❌ Could not connect to Gmail SMTP: {e}")
+            return pd.DataFrame()
+        
+        # Campaign-wide invariants are worked out once, not per recipient
+        mime_subtype = 'html' if is_html else 'plain'
+        
+        # Pull the columns out once; iterating plain arrays avoids building a Series per row
+        email_column = email_list['email'].astype(str)
+        emails = email_column.to_numpy()
+        if 'name' in email_list.columns:
+            names = email_list['name'].fillna('').astype(str).to_numpy()
+        else:
+            names = np.full(total_emails, '', dtype=object)
+        
+        # Validate every address in one pass instead of once per loop iteration
+        valid_mask = email_column.str.match(EMAIL_RE).to_numpy()
+        
+        # Results are written by position into preallocated columns, one DataFrame at the end
+        result_names = names.copy()
+        statuses = np.empty(total_emails, dtype=object)
+        errors = np.full(total_emails, '', dtype=object)
+        timestamps = np.full(total_emails, None, dtype=object)
+        
+        with ThreadPoolExecutor(max_workers=SMTP_POOL_SIZE) as executor:
+            # Personalize on the main thread, send on the workers; only a small window of
+            # rendered messages is in flight, so bodies are built just before they are sent
+            futures = {}
+            positions = iter(range(total_emails))
             
-            results.append({
-                "email": row['email'],
-                "name": name,
-                "status": status,
-                "error": error_msg if not success else "",
-                "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            })
+            def submit_next():
+                """Personalize and submit the next valid recipient, recording invalid ones on the way"""
+                nonlocal invalid_count
+                for position in positions:
+                    email, name = emails[position], names[position]
+                    if not valid_mask[position]:
+                        invalid_count += 1
+                        result_names[position] = name or 'Unknown'
+                        statuses[position] = "invalid"
+                        errors[position] = "Invalid email format"
+                        continue
+                    
+                    # Prepare personalized content
+                    name = name or personalizer.extract_name_from_email(email)
+                    result_names[position] = name
+                    personalized_body = personalizer.personalize_template(body_template, name, email)
+                    personalized_subject = personalizer.personalize_template(subject, name, email)
+                    
+                    future = executor.submit(
+                        self._send_pooled,
+                        pool,
+                        limiter,
+                        email,
+                        personalized_subject,
+                        personalized_body,
+                        mime_subtype
+                    )
+                    futures[future] = position
+                    return True
+                return False
             
-            # Update metrics
-            with metrics_placeholder.container():
-                col1, col2, col3, col4 = st.columns(4)
-                col1.metric("✅ Sent", sent_count)
-                col2.metric("❌ Failed", failed_count)
-                col3.metric("⚠️ Invalid", invalid_count)
-                col4.metric("📊 Progress", f"{progress * 100:.1f}%")
+            while len(futures) < SMTP_SEND_WINDOW and submit_next():
+                pass
             
-            # Delay to avoid rate limiting
-            time.sleep(2)
+            # Collect results as workers finish, topping the window back up; Streamlit is only touched from this thread
+            ui_step = max(1, total_emails // 100)
+            last_ui_count = 0
+            last_ui_time = time.monotonic()
+            while futures:
+                done, _ = wait(futures, return_when=FIRST_COMPLETED)
+                for future in done:
+                    position = futures.pop(future)
+                    success, error_msg = future.result()
+                    if success:
+                        sent_count += 1
+                        statuses[position] = "sent"
+                    else:
+                        failed_count += 1
+                        statuses[position] = "failed"
+                        errors[position] = error_msg
+                    timestamps[position] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+                    submit_next()
+                email = emails[position]
+                
+                # Update progress and metrics every ~1% or half second rather than on every email
+                processed = sent_count + failed_count + invalid_count
+                progress = processed / total_emails
+                now = time.monotonic()
+                if processed - last_ui_count >= ui_step or now - last_ui_time > 0.5 or processed == total_emails:
+                    progress_placeholder.progress(progress)
+                    status_placeholder.text(f"Sent {processed} of {total_emails} (latest: {email})...")
+                    with metrics_placeholder.container():
+                        col1, col2, col3, col4 = st.columns(4)
+                        col1.metric("✅ Sent", sent_count)
+                        col2.metric("❌ Failed", failed_count)
+                        col3.metric("⚠️ Invalid", invalid_count)
+                        col4.metric("📊 Progress", f"{progress * 100:.1f}%")
+                    last_ui_count, last_ui_time = processed, now
         
         # Final update
         progress_placeholder.progress(1.0)
         status_placeholder.success("🎉 Email campaign completed!")
         
-        return pd.DataFrame(results)
+        return pd.DataFrame({
+            "email": emails,
+            "name": result_names,
+            "status": statuses,
+            "error": errors,
+            "timestamp": timestamps
+        }, dtype=SESSION_STRING_DTYPE)
 
 class FileProcessor:
     """Process files and extract contacts"""
     
     def __init__(self):
-        self.email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
         self.personalizer = EmailPersonalizer()
     
-    def process_file(self, uploaded_file):
+    def process_file(self, file_bytes, file_name):
         """Process uploaded file and extract contacts"""
         try:
-            file_extension = uploaded_file.name.split('.')[-1].lower()
+            file_extension = file_name.split('.')[-1].lower()
             
+            # Peek at the header first, then parse only the contact columns as plain strings
             if file_extension == 'csv':
-                df = pd.read_csv(uploaded_file)
+                header = pd.read_csv(io.BytesIO(file_bytes), nrows=0).columns
+                usecols = self._contact_columns(header)
+                try:
+                    # pyarrow parses multithreaded, several times faster than the C engine
+                    df = pd.read_csv(io.BytesIO(file_bytes), usecols=usecols, dtype=str, engine='pyarrow')
+                except ValueError:
+                    # pyarrow rejects some CSV quirks the C parser tolerates
+                    df = pd.read_csv(io.BytesIO(file_bytes), usecols=usecols, dtype=str,
+                                     engine='c', low_memory=False)
             elif file_extension in ['xlsx', 'xls']:
-                df = pd.read_excel(uploaded_file)
+                header = pd.read_excel(io.BytesIO(file_bytes), nrows=0).columns
+                usecols = self._contact_columns(header)
+                try:
+                    # calamine is a Rust reader, far faster than openpyxl when installed
+                    df = pd.read_excel(io.BytesIO(file_bytes), usecols=usecols, dtype=str, engine='calamine')
+                except ImportError:
+                    df = pd.read_excel(io.BytesIO(file_bytes), usecols=usecols, dtype=str)
             else:
                 st.error("Unsupported file format")
                 return None
@@ -266,49 +720,98 @@ class FileProcessor:
         df.columns = df.columns.str.lower()
         
         # Find email and name columns
+        email_col, name_col = self._find_columns(df.columns)
+        
+        if email_col is None:
+            st.error("No email column found in the file")
+            return None
+        
+        # Drop rows without an email address
+        emails = df[email_col].dropna().astype(str).str.strip().str.lower()
+        emails = emails[emails != '']
+        
+        # Each address is validated and mailed once, keeping the first row it appears on
+        duplicated = emails.duplicated()
+        if duplicated.any():
+            st.caption(f"Removed {int(duplicated.sum())} duplicate email addresses")
+            emails = emails[~duplicated]
+        
+        # Validate emails: regex pre-filter on the whole column, email_validator syntax check on survivors only
+        valid = emails.str.match(EMAIL_RE)
+        valid[valid] = emails[valid].map(self._is_valid_email).astype(bool)
+        
+        # The DNS deliverability check depends only on the domain: resolve each distinct domain once, concurrently
+        domains = emails[valid].str.extract(EMAIL_DOMAIN_RE, expand=False).str.lower()
+        unique_domains = domains.unique()
+        with ThreadPoolExecutor(max_workers=DNS_LOOKUP_WORKERS) as executor:
+            deliverable = dict(zip(unique_domains, executor.map(self._is_deliverable_domain, unique_domains)))
+        valid[valid] = domains.map(deliverable).astype(bool)
+        
+        if not valid.any():
+            st.error("No valid emails found")
+            return None
+        emails = emails[valid]
+        
+        # Use the name column where filled in; only the remaining rows need a name derived from the email
+        if name_col:
+            names = df.loc[emails.index, name_col].fillna('').astype(str).str.strip()
+        else:
+            names = pd.Series('', index=emails.index)
+        missing = names == ''
+        if missing.any():
+            names[missing] = emails[missing].map(self.personalizer.extract_name_from_email)
+        
+        return pd.DataFrame({'email': emails, 'name': names}, dtype=SESSION_STRING_DTYPE).reset_index(drop=True)
+    
+    @staticmethod
+    def _find_columns(columns):
+        """Find the email and name columns, matching labels case-insensitively"""
         email_col = None
         name_col = None
         
-        for col in df.columns:
-            if 'email' in col or 'mail' in col:
+        for col in columns:
+            label = str(col).lower()
+            if 'email' in label or 'mail' in label:
                 email_col = col
                 break
         
-        for col in df.columns:
-            if 'name' in col or 'first' in col or 'last' in col:
+        for col in columns:
+            label = str(col).lower()
+            if 'name' in label or 'first' in label or 'last' in label:
                 name_col = col
                 break
         
+        return email_col, name_col
+    
+    def _contact_columns(self, columns):
+        """Columns worth parsing from an upload, or None to read them all"""
+        email_col, name_col = self._find_columns(columns)
         if email_col is None:
-            st.error("No email column found in the file")
             return None
+        return [col for col in (email_col, name_col) if col is not None]
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=65536)
+    def _is_valid_email(email):
+        from email_validator import validate_email, EmailNotValidError
         
-        # Create result dataframe
-        result_data = []
-        
-        for _, row in df.iterrows():
-            email = row[email_col]
-            if pd.isna(email) or email.strip() == '':
-                continue
-            
-            # Get name
-            if name_col and not pd.isna(row[name_col]):
-                name = str(row[name_col]).strip()
-            else:
-                name = self.personalizer.extract_name_from_email(email)
-            
-            # Validate email
-            try:
-                validate_email(email)
-                result_data.append({'email': email, 'name': name})
-            except EmailNotValidError:
-                continue
-        
-        if not result_data:
-            st.error("No valid emails found")
-            return None
+        try:
+            validate_email(email, check_deliverability=False)
+            return True
+        except EmailNotValidError:
+            return False
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
+    def _is_deliverable_domain(domain):
+        """Check once per domain that it can receive mail (MX/A records)"""
+        from email_validator import validate_email, EmailNotValidError
         
-        return pd.DataFrame(result_data)
+        try:
+            validate_email(f"postmaster@{domain}")
+            return True
+        except EmailNotValidError:
+            return False
 
 class CampaignGenerator:
     """Generate campaigns using Groq API"""
@@ -317,40 +820,58 @@ class CampaignGenerator:
         self.client = None
         if GROQ_API_KEY:
             try:
-                self.client = Groq(api_key=GROQ_API_KEY)
+                self.client = get_groq_client()
             except Exception as e:
                 st.error(f"Failed to initialize Groq: {e}")
     
-    def generate_campaign_blueprint(self, campaign_data):
-        """Generate campaign blueprint using Groq"""
+    def generate_campaign_blueprint(self, campaign_data, regenerate=False):
+        """Generate campaign blueprint using Groq; regenerate skips the cache for a fresh response"""
         if not self.client:
             return self._fallback_blueprint(campaign_data)
         
         try:
-            prompt = self._build_campaign_prompt(campaign_data)
-            
-            response = self.client.chat.completions.create(
-                messages=[
-                    {
-                        "role": "system", 
-                        "content": "You are a world-class marketing strategist. Create detailed, actionable marketing campaigns."
-                    },
-                    {
-                        "role": "user", 
-                        "content": prompt
-                    }
-                ],
-                model="openai/gpt-oss-20b",
-                temperature=0.7,
-                max_tokens=4000
+            if regenerate:
+                return self._request_blueprint(campaign_data)
+            return cached_campaign_blueprint(
+                self,
+                campaign_data.get('company_name'),
+                campaign_data.get('campaign_type'),
+                campaign_data.get('target_audience'),
+                campaign_data.get('location'),
+                campaign_data.get('city_state'),
+                tuple(campaign_data.get('channels', [])),
+                campaign_data.get('budget'),
+                campaign_data.get('currency'),
+                campaign_data.get('duration'),
+                campaign_data.get('product_description')
             )
             
-            return response.choices[0].message.content
-            
         except Exception as e:
             st.error(f"Error generating campaign: {e}")
             return self._fallback_blueprint(campaign_data)
     
+    def _request_blueprint(self, campaign_data):
+        """Request a campaign blueprint from Groq"""
+        prompt = self._build_campaign_prompt(campaign_data)
+        
+        response = self.client.chat.completions.create(
+            messages=[
+                {
+                    "role": "system", 
+                    "content": "You are a world-class marketing strategist. Create detailed, actionable marketing campaigns."
+                },
+                {
+                    "role": "user", 
+                    "content": prompt
+                }
+            ],
+            model="openai/gpt-oss-20b",
+            temperature=0.7,
+            max_tokens=4000
+        )
+        
+        return response.choices[0].message.content
+    
     def _build_campaign_prompt(self, data):
         """Build comprehensive campaign prompt"""
         return f"""
@@ -418,71 +939,124 @@ class CampaignGenerator:
 # STREAMLIT APP
 # ================================
 
-st.set_page_config(
-    page_title="Marketing Campaign Generator",
-    page_icon="🚀",
-    layout="wide",
-    initial_sidebar_state="expanded"
-)
-
-# Initialize session state
-initialize_session_state()
-
-# Custom CSS
-st.markdown("""
+# Custom CSS, injected on every run (Streamlit drops elements a rerun does not emit)
+CUSTOM_CSS = """
+<link rel="preconnect" href="https://fonts.googleapis.com">
+<link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>
+<link href="https://fonts.googleapis.com/css2?family=Inter:wght@400;600;700&display=swap" rel="stylesheet">
 <style>
-    @import url('https://fonts.googleapis.com/css2?family=Inter:wght@300;400;500;600;700&display=swap');
+    :root {
+        --hdr: #00d4ff;
+        --radius: 8px;
+        --radius-lg: 10px;
+        --grad-bg: linear-gradient(135deg, #0f0f23 0%, #1a1a2e 100%);
+        --grad-side: linear-gradient(180deg, #16213e 0%, #0f3460 100%);
+        --grad-btn: linear-gradient(45deg, #00d4ff, #0099cc);
+        --grad-success: linear-gradient(135deg, #28a745 0%, #20c997 100%);
+    }
     
     .stApp {
-        background: linear-gradient(135deg, #0f0f23 0%, #1a1a2e 100%);
+        background: var(--grad-bg);
         font-family: 'Inter', sans-serif;
     }
     
-    .css-1d391kg {
-        background: linear-gradient(180deg, #16213e 0%, #0f3460 100%);
+    section[data-testid="stSidebar"] > div {
+        background: var(--grad-side);
     }
     
-    h1, h2, h3 {
-        color: #00d4ff !important;
-        font-weight: 600 !important;
+    .stApp :is(h1, h2, h3) {
+        color: var(--hdr);
+        font-weight: 600;
     }
     
     .stButton > button {
-        background: linear-gradient(45deg, #00d4ff, #0099cc);
+        background: var(--grad-btn);
         color: white;
         border: none;
-        border-radius: 10px;
+        border-radius: var(--radius-lg);
         padding: 0.75rem 1.5rem;
         font-weight: 600;
-        transition: all 0.3s ease;
+        transition: transform 0.3s ease;
         box-shadow: 0 4px 15px rgba(0, 212, 255, 0.3);
         width: 100%;
+        position: relative;
+        will-change: transform;
+    }
+    
+    .stButton > button::after {
+        content: "";
+        position: absolute;
+        inset: 0;
+        border-radius: inherit;
+        box-shadow: 0 6px 20px rgba(0, 212, 255, 0.4);
+        opacity: 0;
+        transition: opacity 0.3s ease;
+        pointer-events: none;
     }
     
     .stButton > button:hover {
         transform: translateY(-2px);
-        box-shadow: 0 6px 20px rgba(0, 212, 255, 0.4);
     }
     
-    .stTextInput > div > div > input,
-    .stTextArea > div > div > textarea,
-    .stSelectbox > div > div > select {
-        background-color: #1e1e1e !important;
-        color: #ffffff !important;
-        border: 1px solid #333 !important;
-        border-radius: 8px !important;
+    .stButton > button:hover::after {
+        opacity: 1;
     }
     
+    .stApp :where(.stTextInput, .stTextArea, .stSelectbox) :is(input, textarea, select) {
+        background-color: #1e1e1e;
+        color: #ffffff;
+        border: 1px solid #333;
+        border-radius: var(--radius);
+    }
+</style>
+"""
+
+# Only needed once campaign results are on screen, so it is injected alongside them
+RESULTS_CSS = """
+<style>
     .success-metric {
-        background: linear-gradient(135deg, #28a745 0%, #20c997 100%);
+        background: var(--grad-success);
         color: white;
         padding: 1rem;
-        border-radius: 8px;
+        border-radius: var(--radius);
         text-align: center;
         font-weight: 600;
     }
 </style>
-""", unsafe_allow_html=True)
+"""
+
+def minify_css(css):
+    """Collapse whitespace, then drop it around braces and semicolons"""
+    return re.sub(r'\s*([{};])\s*', r'\1', re.sub(r'\s+', ' ', css)).strip()
+
+# Minified once at import. Being a single line also keeps the markdown renderer
+# from ending the HTML block at a blank line.
+CUSTOM_CSS = minify_css(CUSTOM_CSS)
+RESULTS_CSS = minify_css(RESULTS_CSS)
+
+st.set_page_config(
+    page_title="Marketing Campaign Generator",
+    page_icon="🚀",
+    layout="wide",
+    initial_sidebar_state="expanded"
+)
+
+# Initialize session state
+initialize_session_state()
+
+# Custom CSS
+st.markdown(CUSTOM_CSS, unsafe_allow_html=True)
+
+def go_to_page(page):
+    """Button callback that switches the page shown on the next run"""
+    st.session_state.current_page = page
+
+def regenerate_blueprint():
+    """Button callback that asks the AI for a fresh strategy for the current campaign"""
+    with st.spinner("🤖 AI is generating a new campaign strategy..."):
+        generator = CampaignGenerator()
+        st.session_state.campaign_blueprint = generator.generate_campaign_blueprint(
+            st.session_state.current_campaign, regenerate=True)
 
 def main():
     # Header
@@ -497,18 +1071,10 @@ def main():
     with st.sidebar:
         st.markdown("### 🎯 Navigation")
         
-        # Navigation buttons that update session state
-        if st.button("🎯 Campaign Dashboard", use_container_width=True):
-            st.session_state.current_page = "Campaign Dashboard"
-            st.rerun()
-        
-        if st.button("📧 Email Marketing", use_container_width=True):
-            st.session_state.current_page = "Email Marketing"
-            st.rerun()
-        
-        if st.button("📊 Analytics & Reports", use_container_width=True):
-            st.session_state.current_page = "Analytics & Reports"
-            st.rerun()
+        # Navigation buttons switch page in a click callback, so the click's own rerun draws the new page
+        st.button("🎯 Campaign Dashboard", use_container_width=True, on_click=go_to_page, args=("Campaign Dashboard",))
+        st.button("📧 Email Marketing", use_container_width=True, on_click=go_to_page, args=("Email Marketing",))
+        st.button("📊 Analytics & Reports", use_container_width=True, on_click=go_to_page, args=("Analytics & Reports",))
         
         st.markdown("---")
         
@@ -624,16 +1190,15 @@ def show_campaign_dashboard():
         st.markdown(st.session_state.campaign_blueprint)
         
         # Action buttons
-        col1, col2, col3 = st.columns(3)
+        col1, col2, col3, col4 = st.columns(4)
         with col1:
-            if st.button("📧 Create Email Campaign", use_container_width=True):
-                st.session_state.current_page = "Email Marketing"
-                st.rerun()
+            st.button("📧 Create Email Campaign", use_container_width=True, on_click=go_to_page, args=("Email Marketing",))
         with col2:
-            if st.button("📊 View Analytics", use_container_width=True):
-                st.session_state.current_page = "Analytics & Reports"
-                st.rerun()
+            st.button("📊 View Analytics", use_container_width=True, on_click=go_to_page, args=("Analytics & Reports",))
         with col3:
+            if st.session_state.current_campaign:
+                st.button("🔄 Regenerate Strategy", use_container_width=True, on_click=regenerate_blueprint)
+        with col4:
             if st.session_state.current_campaign:
                 st.download_button("📄 Download Strategy", 
                     data=st.session_state.campaign_blueprint,
@@ -666,50 +1231,11 @@ def show_email_marketing():
         if st.button("🚀 Generate Email Content", use_container_width=True):
             if st.session_state.campaign_blueprint:
                 # Simple template generation
+                company_name = st.session_state.current_campaign['company_name'] if st.session_state.current_campaign else 'Marketing'
                 if content_format == "HTML Template":
-                    template = f"""
-<!DOCTYPE html>
-<html>
-<head><title>{email_type}</title></head>
-<body style="font-family: Arial, sans-serif; max-width: 600px; margin: 0 auto; padding: 20px;">
-    <div style="background: linear-gradient(135deg, #00d4ff, #0099cc); color: white; padding: 30px; text-align: center; border-radius: 8px 8px 0 0;">
-        <h1>Hello {{{{first_name}}}}!</h1>
-    </div>
-    <div style="padding: 30px; background: white; color: #333;">
-        <p>We're excited to share this {email_type.lower()} with you.</p>
-        <p>As someone who values quality, we thought you'd be interested in what we have to offer.</p>
-        <div style="text-align: center; margin: 30px 0;">
-            <a href="#" style="background: #00d4ff; color: white; padding: 15px 30px; text-decoration: none; border-radius: 5px; font-weight: bold;">Learn More</a>
-        </div>
-        <p>Thank you for being part of our community!</p>
-    </div>
-    <div style="background: #f8f9fa; padding: 20px; text-align: center; border-radius: 0 0 8px 8px;">
-        <p>Best regards,<br>The {st.session_state.current_campaign['company_name'] if st.session_state.current_campaign else 'Marketing'} Team</p>
-    </div>
-</body>
-</html>"""
-                    st.session_state.email_template = template
+                    st.session_state.email_template = cached_email_template(email_type, company_name, True)
                 else:
-                    template = f"""Subject: {email_type} from {{{{first_name}}}}
-
-Hello {{{{first_name}}}},
-
-We're excited to share this {email_type.lower()} with you.
-
-As someone who values quality, we thought you'd be interested in what we have to offer.
-
-Here's what makes this special:
-- Personalized for you
-- Exclusive benefits
-- Limited time opportunity
-
-Ready to learn more? Visit our website or reply to this email.
-
-Thank you for being part of our community!
-
-Best regards,
-The {st.session_state.current_campaign['company_name'] if st.session_state.current_campaign else 'Marketing'} Team"""
-                    st.session_state.plain_text_template = template
+                    st.session_state.plain_text_template = cached_email_template(email_type, company_name, False)
                 
                 st.success("✨ Email content generated!")
             else:
@@ -739,7 +1265,7 @@ The {st.session_state.current_campaign['company_name'] if st.session_state.curre
         
         # Preview HTML
         if edit_choice == "HTML Template" and st.button("👀 Preview Email"):
-            personalizer = EmailPersonalizer()
+            personalizer = get_personalizer()
             preview = personalizer.personalize_template(edited_content, "John Smith", "john@example.com")
             st.components.v1.html(preview, height=500, scrolling=True)
     
@@ -752,8 +1278,7 @@ The {st.session_state.current_campaign['company_name'] if st.session_state.curre
         type=['csv', 'xlsx'], key="contact_upload")
     
     if uploaded_file:
-        processor = FileProcessor()
-        contacts = processor.process_file(uploaded_file)
+        contacts = cached_contacts(uploaded_file.getvalue(), uploaded_file.name)
         
         if contacts is not None:
             st.session_state.email_contacts = contacts
@@ -769,7 +1294,10 @@ The {st.session_state.current_campaign['company_name'] if st.session_state.curre
                 num_rows="dynamic",
                 use_container_width=True
             )
-            st.session_state.email_contacts = edited_contacts
+            edited_contacts = edited_contacts.astype(SESSION_STRING_DTYPE)
+            # The editor can re-add an address already in the list; keep its first row so counts match what is sent
+            st.session_state.email_contacts = edited_contacts[
+                ~edited_contacts['email'].str.strip().str.lower().duplicated()].reset_index(drop=True)
     
     # Email campaign launch
     if (st.session_state.email_contacts is not None and 
@@ -785,7 +1313,7 @@ The {st.session_state.current_campaign['company_name'] if st.session_state.curre
         with col1:
             st.metric("👥 Contacts", len(df))
         with col2:
-            domains = df['email'].str.split('@').str[1].nunique()
+            domains = df['email'].str.extract(EMAIL_DOMAIN_RE, expand=False).nunique()
             st.metric("🏢 Domains", domains)
         with col3:
             st.metric("📧 Template", "✅ Ready")
@@ -815,8 +1343,8 @@ The {st.session_state.current_campaign['company_name'] if st.session_state.curre
         
         # Test email
         if test_email and st.button("🧪 Send Test", use_container_width=True):
-            email_handler = EmailHandler()
-            personalizer = EmailPersonalizer()
+            email_handler = get_email_handler()
+            personalizer = get_personalizer()
             
             test_content = personalizer.personalize_template(template_to_use, "Test User", test_email)
             test_subject = personalizer.personalize_template(subject, "Test User", test_email)
@@ -829,74 +1357,118 @@ The {st.session_state.current_campaign['company_name'] if st.session_state.curre
                 st.error(f"❌ Test failed: {error_msg}")
         
         # Launch button
-        st.markdown("### 🎯 Campaign Launch")
-        
-        if st.button("🚀 LAUNCH EMAIL CAMPAIGN", type="primary", use_container_width=True, key="launch_campaign"):
-            if not GMAIL_USER or not GMAIL_APP_PASSWORD:
-                st.error("❌ Gmail configuration missing!")
-                st.error("Please add GMAIL_USER and GMAIL_APP_PASSWORD to your .env file")
-                st.code("""
+        show_campaign_launch(df, subject, template_to_use, is_html)
+
+def results_to_csv(results):
+    """Serialize campaign results to CSV bytes with pyarrow's multithreaded writer"""
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+    
+    buffer = io.BytesIO()
+    pa_csv.write_csv(pa.Table.from_pandas(results, preserve_index=False), buffer)
+    return buffer.getvalue()
+
+@st.dialog("Confirm campaign launch")
+def confirm_campaign_launch(email_count):
+    """Ask for confirmation in a modal; the send itself runs in show_campaign_launch"""
+    st.warning(f"⚠️ About to send {email_count} emails. This cannot be undone!")
+    
+    if st.button("✅ CONFIRM & SEND", type="primary", use_container_width=True):
+        st.session_state.launch_confirmed = True
+        st.rerun()
+
+@st.fragment
+def show_campaign_launch(df, subject, template_to_use, is_html):
+    """Launch controls and results; clicks here rerun only this fragment, not the whole page"""
+    st.markdown("### 🎯 Campaign Launch")
+    
+    if st.button("🚀 LAUNCH EMAIL CAMPAIGN", type="primary", use_container_width=True, key="launch_campaign"):
+        if not GMAIL_USER or not GMAIL_APP_PASSWORD:
+            st.error("❌ Gmail configuration missing!")
+            st.error("Please add GMAIL_USER and GMAIL_APP_PASSWORD to your .env file")
+            st.code("""
 # Add to .env file:
 GMAIL_USER=your_email@gmail.com
 GMAIL_APP_PASSWORD=your_16_digit_app_password
-                """)
-                st.stop()
+            """)
+            st.stop()
+        
+        confirm_campaign_launch(len(df))
+    
+    # Set by the confirmation dialog; consumed here so a later rerun does not send twice
+    if st.session_state.launch_confirmed:
+        st.session_state.launch_confirmed = False
+        st.info("🚀 Starting email campaign...")
+        
+        # Initialize components
+        email_handler = get_email_handler()
+        personalizer = get_personalizer()
+        
+        # Send emails
+        results = email_handler.send_bulk_emails_fixed(
+            df, subject, template_to_use, personalizer, is_html
+        )
+        
+        if not results.empty:
+            # Show final results
+            success_count = len(results[results['status'] == 'sent'])
+            failed_count = len(results[results['status'] == 'failed'])
+            invalid_count = len(results[results['status'] == 'invalid'])
+            success_rate = (success_count / len(results)) * 100
             
-            # Confirmation
-            st.warning(f"⚠️ About to send {len(df)} emails. This cannot be undone!")
+            st.markdown("### 🎉 Campaign Results")
             
-            # Use a unique key for the confirmation button
-            confirm_key = f"confirm_launch_{datetime.now().timestamp()}"
+            result_col1, result_col2, result_col3, result_col4 = st.columns(4)
             
-            if st.button("✅ CONFIRM & SEND", key=confirm_key):
-                st.info("🚀 Starting email campaign...")
-                
-                # Initialize components
-                email_handler = EmailHandler()
-                personalizer = EmailPersonalizer()
-                
-                # Send emails
-                results = email_handler.send_bulk_emails_fixed(
-                    df, subject, template_to_use, personalizer, is_html
-                )
-                
-                if not results.empty:
-                    # Show final results
-                    success_count = len(results[results['status'] == 'sent'])
-                    failed_count = len(results[results['status'] == 'failed'])
-                    invalid_count = len(results[results['status'] == 'invalid'])
-                    success_rate = (success_count / len(results)) * 100
-                    
-                    st.markdown("### 🎉 Campaign Results")
-                    
-                    result_col1, result_col2, result_col3, result_col4 = st.columns(4)
-                    
-                    with result_col1:
-                        st.markdown(f'<div class="success-metric">✅ Sent<br><h2>{success_count}</h2></div>', unsafe_allow_html=True)
-                    with result_col2:
-                        st.metric("❌ Failed", failed_count)
-                    with result_col3:
-                        st.metric("⚠️ Invalid", invalid_count)
-                    with result_col4:
-                        st.metric("📊 Success Rate", f"{success_rate:.1f}%")
-                    
-                    # Store results
-                    st.session_state.campaign_results = results
-                    
-                    # Download option
-                    csv = results.to_csv(index=False)
-                    st.download_button("📥 Download Results", 
-                        data=csv, 
-                        file_name=f"campaign_results_{datetime.now().strftime('%Y%m%d_%H%M')}.csv",
-                        mime="text/csv")
-                    
-                    # Show details
-                    with st.expander("📋 View Detailed Results"):
-                        st.dataframe(results, use_container_width=True)
-                    
-                    st.balloons()
+            with result_col1:
+                st.markdown(RESULTS_CSS + f'<div class="success-metric">✅ Sent<br><h2>{success_count}</h2></div>', unsafe_allow_html=True)
+            with result_col2:
+                st.metric("❌ Failed", failed_count)
+            with result_col3:
+                st.metric("⚠️ Invalid", invalid_count)
+            with result_col4:
+                st.metric("📊 Success Rate", f"{success_rate:.1f}%")
+            
+            # Store results
+            st.session_state.campaign_results = results
+            
+            # Download option
+            # The CSV is only written when the button is clicked, not on every rerun
+            st.download_button("📥 Download Results", 
+                data=lambda: results_to_csv(results), 
+                file_name=f"campaign_results_{datetime.now().strftime('%Y%m%d_%H%M')}.csv",
+                mime="text/csv")
+            
+            # Show details
+            with st.expander("📋 View Detailed Results"):
+                st.dataframe(results, use_container_width=True)
+            
+            st.balloons()
+
+@st.fragment
+def show_performance_charts(data_df, numeric_cols):
+    """Charts for uploaded data; changing a selectbox reruns only this fragment, not the whole page"""
+    st.subheader("📈 Performance Charts")
+    
+    chart_col1, chart_col2 = st.columns(2)
+    
+    with chart_col1:
+        selected_col = st.selectbox("Select metric:", numeric_cols)
+        fig = cached_histogram(data_df, selected_col)
+        st.plotly_chart(fig, use_container_width=True)
+    
+    with chart_col2:
+        if len(numeric_cols) > 1:
+            col1 = st.selectbox("X-axis:", numeric_cols, index=0)
+            col2 = st.selectbox("Y-axis:", numeric_cols, index=1)
+            
+            fig = cached_scatter(data_df, col1, col2)
+            st.plotly_chart(fig, use_container_width=True)
 
 def show_analytics_reports():
+    # plotly.express costs ~300 ms to import; only this page draws charts
+    import plotly.express as px
+    
     st.header("📊 Campaign Analytics & Reports")
     
     # Show campaign-based map if campaign exists
@@ -909,34 +1481,8 @@ def show_analytics_reports():
         if location in COUNTRIES_DATA:
             coords = COUNTRIES_DATA[location]['coords']
             
-            # Create map data
-            map_data = pd.DataFrame({
-                'lat': [coords[0]],
-                'lon': [coords[1]], 
-                'location': [location],
-                'campaign': [campaign['campaign_type']],
-                'company': [campaign['company_name']]
-            })
-            
-            # Display map using plotly
-            fig = px.scatter_mapbox(
-                map_data,
-                lat='lat',
-                lon='lon',
-                hover_name='location',
-                hover_data={'campaign': True, 'company': True, 'lat': False, 'lon': False},
-                color_discrete_sequence=['#00d4ff'],
-                size_max=15,
-                zoom=3,
-                title=f"Campaign Target Location: {location}"
-            )
-            
-            fig.update_layout(
-                mapbox_style="carto-darkmatter",
-                mapbox_accesstoken=None,
-                template="plotly_dark",
-                height=500
-            )
+            # Figure is rebuilt only when the campaign's location or labels change
+            fig = cached_location_map(location, coords[0], coords[1], campaign['campaign_type'], campaign['company_name'])
             
             st.plotly_chart(fig, use_container_width=True)
             
@@ -1017,26 +1563,18 @@ def show_analytics_reports():
         with metrics_col4:
             st.metric("📊 Success Rate", f"{success_rate:.1f}%")
         
-        # Results pie chart
+        # Results pie chart, cached on the status counts
         status_counts = results_df['status'].value_counts()
-        fig = px.pie(
-            values=status_counts.values, 
-            names=status_counts.index,
-            title="Email Campaign Results Distribution",
-            color_discrete_map={'sent': '#28a745', 'failed': '#dc3545', 'invalid': '#ffc107'}
-        )
-        fig.update_layout(template="plotly_dark")
+        fig = cached_results_pie(tuple(status_counts.items()))
         st.plotly_chart(fig, use_container_width=True)
         
         # Domain analysis
         if total_sent > 0:
             sent_emails = results_df[results_df['status'] == 'sent']
-            sent_emails['domain'] = sent_emails['email'].str.split('@').str[1]
+            sent_emails['domain'] = sent_emails['email'].str.extract(EMAIL_DOMAIN_RE, expand=False)
             domain_counts = sent_emails['domain'].value_counts().head(10)
             
-            fig = px.bar(x=domain_counts.index, y=domain_counts.values,
-                        title="Top Email Domains Reached")
-            fig.update_layout(template="plotly_dark")
+            fig = cached_domain_bar(tuple(domain_counts.items()))
             st.plotly_chart(fig, use_container_width=True)
         
         # Detailed results
@@ -1052,53 +1590,35 @@ def show_analytics_reports():
     
     if uploaded_data:
         try:
-            if uploaded_data.name.endswith('.csv'):
-                data_df = pd.read_csv(uploaded_data)
-            else:
-                data_df = pd.read_excel(uploaded_data)
+            data_bytes = uploaded_data.getvalue()
             
-            st.success(f"✅ Data uploaded: {len(data_df)} records")
-            
-            # Basic analysis
-            st.subheader("📊 Data Overview")
+            # Only the first rows are parsed up front; the full file is read when the analysis is asked for
+            preview_df = cached_performance_preview(data_bytes, uploaded_data.name)
             
-            overview_col1, overview_col2, overview_col3 = st.columns(3)
-            
-            with overview_col1:
-                st.metric("📊 Records", len(data_df))
-            with overview_col2:
-                st.metric("📈 Columns", len(data_df.columns))
-            with overview_col3:
-                missing = data_df.isnull().sum().sum()
-                st.metric("❓ Missing Values", missing)
+            st.success(f"✅ Data uploaded: {len(preview_df.columns)} columns")
             
             # Show data preview
-            st.dataframe(data_df.head(), use_container_width=True)
-            
-            # Generate charts for numeric columns
-            numeric_cols = data_df.select_dtypes(include=[np.number]).columns
+            st.subheader("📊 Data Overview")
+            st.dataframe(preview_df.head(), use_container_width=True)
             
-            if len(numeric_cols) > 0:
-                st.subheader("📈 Performance Charts")
+            if st.toggle("📈 Run full analysis", key="analytics_full_analysis"):
+                data_df = cached_performance_data(data_bytes, uploaded_data.name)
+                
+                overview_col1, overview_col2, overview_col3 = st.columns(3)
                 
-                chart_col1, chart_col2 = st.columns(2)
+                with overview_col1:
+                    st.metric("📊 Records", len(data_df))
+                with overview_col2:
+                    st.metric("📈 Columns", len(data_df.columns))
+                with overview_col3:
+                    missing = data_df.isnull().sum().sum()
+                    st.metric("❓ Missing Values", missing)
                 
-                with chart_col1:
-                    selected_col = st.selectbox("Select metric:", numeric_cols)
-                    fig = px.histogram(data_df, x=selected_col, 
-                                     title=f"Distribution of {selected_col}")
-                    fig.update_layout(template="plotly_dark")
-                    st.plotly_chart(fig, use_container_width=True)
+                # Generate charts for numeric columns
+                numeric_cols = data_df.select_dtypes(include=[np.number]).columns
                 
-                with chart_col2:
-                    if len(numeric_cols) > 1:
-                        col1 = st.selectbox("X-axis:", numeric_cols, index=0)
-                        col2 = st.selectbox("Y-axis:", numeric_cols, index=1)
-                        
-                        fig = px.scatter(data_df, x=col1, y=col2,
-                                       title=f"{col1} vs {col2}")
-                        fig.update_layout(template="plotly_dark")
-                        st.plotly_chart(fig, use_container_width=True)
+                if len(numeric_cols) > 0:
+                    show_performance_charts(data_df, numeric_cols)
         
         except Exception as e:
             st.error(f"Error processing data: {e}")